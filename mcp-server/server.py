@@ -25,12 +25,20 @@ if sys.platform == 'win32':
             pass
 # ---------------------------------------------
 
-import httpx
+import aiohttp
+import orjson
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxhtml
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
+# Optional Aho-Corasick automaton for single-pass multi-keyword matching
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Initialize MCP server
 app = Server("physionet-intelligence-server")
 
@@ -44,42 +52,170 @@ DB_FILE.parent.mkdir(parents=True, exist_ok=True)
 
 PHYSIONET_BASE = "https://physionet.org"
 
+# Byte cap for project page fetches; head, title and abstract fit well within it.
+# Everything after it (keywords, sizes, license) is only matched if it falls inside the cap.
+MAX_PAGE_BYTES = 64 * 1024
+# Ask the server to end the body at the cap, so the connection can go back to the pool
+_PAGE_RANGE_HEADERS = {"Range": f"bytes=0-{MAX_PAGE_BYTES - 1}"}
+
+# Number of fields in an extract_metadata record, used for the completeness ratio
+TOTAL_FIELDS = 15
+
+_MODALITY_KW = {
+    "ECG": ("ecg", "electrocardiogram"),
+    "PCG": ("pcg", "phonocardiogram", "heart sound"),
+    "EEG": ("eeg", "electroencephalogram"),
+    "EMG": ("emg", "electromyogram"),
+    "PPG": ("ppg", "photoplethysmogram"),
+    "ACC": ("accelerometer",),
+    "Respiratory": ("respiratory", "respiration"),
+    "Blood Pressure": ("blood pressure", "bp"),
+    "Imaging": ("mri", "ct scan", "x-ray", "cbct"),
+    "Clinical Notes": ("clinical notes", "discharge"),
+}
+
+_CONDITION_KW = {
+    "Arrhythmia": ("arrhythmia",),
+    "Atrial Fibrillation": ("atrial fibrillation", "afib"),
+    "Heart Failure": ("heart failure",),
+    "Sleep Apnea": ("sleep apnea",),
+    "Hypertension": ("hypertension",),
+    "Pneumonia": ("pneumonia",),
+    "COVID-19": ("covid-19", "sars-cov-2"),
+}
+
+# Inverted index keyword -> (kind, tag), built once at import
+_KW_INDEX = {kw: ("modality", m) for m, kws in _MODALITY_KW.items() for kw in kws} | \
+            {kw: ("condition", c) for c, kws in _CONDITION_KW.items() for kw in kws}
+
+def _build_kw_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw, tag in _KW_INDEX.items():
+        automaton.add_word(kw, tag)
+    automaton.make_automaton()
+    return automaton
+
+_KW_AUTOMATON = _build_kw_automaton()
+
+def _find_keyword_tags(page_lower: str) -> set:
+    """(kind, tag) pairs for every keyword in the lower-cased page text"""
+    if _KW_AUTOMATON is not None:
+        return {tag for _, tag in _KW_AUTOMATON.iter(page_lower)}
+    return {tag for kw, tag in _KW_INDEX.items() if kw in page_lower}
+
+_VERSION_NODES_XPATH = etree.XPath(
+    '//*[self::dt or self::span or self::p]'
+    '[contains(., "Version") or contains(., "Published") or contains(., "Released")]'
+)
+_SEARCH_HREF_RE = re.compile(r"/content/[^/]+/[^/]+")
+_YEAR_RE = re.compile(r"(19|20)\d{2}")
+# Matched against the lower-cased page text, so Dataset_Size reads e.g. "24 hours"
+_SUBJ_RE = re.compile(r"(\d+)\s*(?:subjects?|patients?)")
+_DUR_RE = re.compile(r"(\d+)\s*(?:hours?|days?)")
+
+# Pages with less text than this are placeholders/errors; skip keyword work on them
+MIN_PAGE_TEXT = 200
+
+# Elements whose text is code, not page content; BeautifulSoup's get_text() skips them too
+_NON_TEXT_TAGS = ("script", "style", "template")
+
+def _parse_page(body: bytes, charset: str | None):
+    # Without an explicit encoding lxml only honours <meta charset> and falls back to Latin-1
+    try:
+        parser = lxhtml.HTMLParser(encoding=charset) if charset else None
+    except LookupError:
+        parser = None
+    try:
+        doc = lxhtml.document_fromstring(body, parser=parser)
+    except etree.ParserError:
+        # Blank placeholder pages: an empty document so every lookup simply misses
+        return lxhtml.Element("html")
+    etree.strip_elements(doc, *_NON_TEXT_TAGS, with_tail=False)
+    return doc
+
+def _write_database(datasets: list[dict]) -> None:
+    # Write to a temp file and swap it in so a crash never leaves a truncated database
+    tmp = DB_FILE.with_suffix('.json.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(orjson.dumps(datasets, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, DB_FILE)
+
 class PhysioNetExtractor:
     """Extract and structure PhysioNet dataset metadata"""
     
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30.0, follow_redirects=True)
+        # aiohttp sessions must be created inside a running event loop
+        self.client: aiohttp.ClientSession | None = None
+        self._db_cache: list[dict] | None = None
+        self._db_mtime: float = 0
+        self._url_set: set[str] = set()
+        self._write_lock = asyncio.Lock()
+        self._pending: list[dict] = []
+    
+    def get_client(self) -> aiohttp.ClientSession:
+        if self.client is None or self.client.closed:
+            # Keep connections to physionet.org alive across a batch instead of re-handshaking
+            self.client = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(
+                    limit=20,
+                    limit_per_host=20,
+                    keepalive_timeout=60,
+                    ttl_dns_cache=300
+                )
+            )
+        return self.client
     
     async def close(self):
-        await self.client.aclose()
+        await self.flush_database()
+        if self.client is not None:
+            await self.client.close()
     
     def load_database(self) -> list[dict]:
+        # Unflushed inserts only exist in the cache, so never reload over them
+        if self._pending:
+            return self._db_cache
+        
         if DB_FILE.exists():
             try:
-                with open(DB_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                mtime = DB_FILE.stat().st_mtime
+                if self._db_cache is not None and mtime == self._db_mtime:
+                    return self._db_cache
+                
+                with open(DB_FILE, 'rb') as f:
+                    self._db_cache = orjson.loads(f.read())
+                self._db_mtime = mtime
+                self._url_set = {d.get('Dataset_URL') for d in self._db_cache}
+                return self._db_cache
             except Exception as e:
                 print(f"Error loading database: {e}", file=sys.stderr)
                 return []
+        self._db_cache = None
+        self._url_set = set()
         return []
     
-    def save_to_database(self, metadata: dict) -> dict:
+    async def add_to_database(self, metadata: dict, flush: bool = False) -> dict:
         try:
             datasets = self.load_database()
             metadata['id'] = int(datetime.now().timestamp() * 1000)
             metadata['curated_date'] = datetime.now().isoformat()
             
-            existing_urls = [d.get('Dataset_URL') for d in datasets]
-            if metadata.get('Dataset_URL') in existing_urls:
+            if metadata.get('Dataset_URL') in self._url_set:
                 print(f"Dataset already exists: {metadata.get('Title')}", file=sys.stderr)
                 return {"status": "exists", "message": "Dataset already in database"}
 
             datasets.insert(0, metadata)
+            self._db_cache = datasets
+            self._url_set.add(metadata['Dataset_URL'])
+            self._pending.append(metadata)
             
-            with open(DB_FILE, 'w', encoding='utf-8') as f:
-                json.dump(datasets, f, indent=2, ensure_ascii=False)
-            
-            print(f"Saved to database: {metadata.get('Title')}", file=sys.stderr)
+            if flush:
+                await self.flush_database()
+                print(f"Saved to database: {metadata.get('Title')}", file=sys.stderr)
+            else:
+                print(f"Queued for database: {metadata.get('Title')}", file=sys.stderr)
             print(f"Total datasets: {len(datasets)}", file=sys.stderr)
             
             return {
@@ -92,37 +228,80 @@ class PhysioNetExtractor:
             print(f"Error saving to database: {e}", file=sys.stderr)
             return {"status": "error", "message": str(e)}
     
+    async def flush_database(self):
+        if not self._pending:
+            return
+        
+        try:
+            # Serialize writes and hand the thread a snapshot the event loop can't mutate
+            async with self._write_lock:
+                # A flush that held the lock may already have written everything
+                if not self._pending:
+                    return
+                # Inserts queued while the thread writes aren't in this snapshot; keep them pending
+                written = len(self._pending)
+                await asyncio.to_thread(_write_database, list(self._db_cache))
+                self._db_mtime = DB_FILE.stat().st_mtime
+                del self._pending[:written]
+        except Exception:
+            # Drop unwritten inserts and force a reload so the cache never drifts from disk
+            self._pending.clear()
+            self._db_cache = None
+            raise
+    
     async def search_dataset(self, query: str) -> list[dict]:
         if query.startswith("http"):
             return [{"title": "Direct URL", "url": query}]
         
         search_url = f"{PHYSIONET_BASE}/search/?q={quote(query)}&t=content"
         try:
-            response = await self.client.get(search_url)
-            response.raise_for_status()
+            async with self.get_client().get(search_url) as response:
+                response.raise_for_status()
+                content = await response.read()
             
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(content, "lxml")
             results = []
+            seen: set[str] = set()
             
-            for link in soup.find_all("a", href=re.compile(r"/content/[^/]+/[^/]+")):
+            for link in soup.find_all("a", href=_SEARCH_HREF_RE):
                 href = link.get("href")
                 if href and "/content/" in href:
                     full_url = f"{PHYSIONET_BASE}{href}" if href.startswith("/") else href
                     title = link.get_text(strip=True)
-                    if title and full_url not in [r["url"] for r in results]:
+                    if title and full_url not in seen:
+                        seen.add(full_url)
                         results.append({"title": title, "url": full_url})
+                        if len(results) == 5:
+                            break
             
-            return results[:5]
+            return results
             
         except Exception as e:
             return [{"error": f"Search failed: {str(e)}"}]
     
     async def extract_metadata(self, url: str) -> dict:
         try:
-            response = await self.client.get(url)
-            response.raise_for_status()
+            async with self.get_client().get(url, headers=_PAGE_RANGE_HEADERS) as response:
+                charset = response.charset
+                if response.status == 416:
+                    # Range not satisfiable: the page body is empty
+                    body = b""
+                elif response.status == 206:
+                    # The server already cut the body at the cap; read it all so keep-alive holds
+                    body = await response.read()
+                else:
+                    response.raise_for_status()
+                    # Range ignored: stop at the cap (aiohttp then drops this connection)
+                    chunks = []
+                    total = 0
+                    async for chunk in response.content.iter_chunked(16384):
+                        chunks.append(chunk)
+                        total += len(chunk)
+                        if total >= MAX_PAGE_BYTES:
+                            break
+                    body = b"".join(chunks)
             
-            soup = BeautifulSoup(response.text, "html.parser")
+            doc = _parse_page(body, charset)
             
             metadata = {
                 "Title": "Not specified",
@@ -141,74 +320,65 @@ class PhysioNetExtractor:
                 "Limitations": "Not specified",
                 "Dataset_URL": url
             }
+            # Dataset_URL and Clinical_Condition always end up with a real value
+            filled = 2
             
-            title_elem = soup.find("h1")
-            if title_elem:
-                metadata["Title"] = title_elem.get_text(strip=True)
+            title_elem = doc.find(".//h1")
+            if title_elem is not None:
+                metadata["Title"] = " ".join(title_elem.text_content().split())
+                filled += 1
             
-            version_elem = soup.find(string=re.compile(r"Version|Published|Released"))
-            if version_elem:
-                year_match = re.search(r"(19|20)\d{2}", str(version_elem))
+            # Version/publication info sits in short dt/span/p elements, so only look there
+            for node in _VERSION_NODES_XPATH(doc):
+                year_match = _YEAR_RE.search(node.text_content())
                 if year_match:
                     metadata["Year"] = year_match.group(0)
+                    filled += 1
+                    break
             
-            abstract = soup.find("div", {"id": "abstract"}) or soup.find("section", {"id": "abstract"})
-            if abstract:
-                desc_text = abstract.get_text(strip=True)
-                metadata["Description"] = " ".join(desc_text.split()[:100])
+            abstract = doc.find('.//div[@id="abstract"]')
+            if abstract is None:
+                abstract = doc.find('.//section[@id="abstract"]')
+            if abstract is not None:
+                metadata["Description"] = " ".join(abstract.text_content().split()[:100])
+                filled += 1
             
-            page_text = soup.get_text().lower()
+            # Keyword and size matching only look at the main content block
+            main = doc.find(".//main")
+            page_text = (main if main is not None else doc).text_content()
             
-            modalities = []
-            modality_keywords = {
-                "ECG": ["ecg", "electrocardiogram"],
-                "PCG": ["pcg", "phonocardiogram", "heart sound"],
-                "EEG": ["eeg", "electroencephalogram"],
-                "EMG": ["emg", "electromyogram"],
-                "PPG": ["ppg", "photoplethysmogram"],
-                "ACC": ["accelerometer"],
-                "Respiratory": ["respiratory", "respiration"],
-                "Blood Pressure": ["blood pressure", "bp"],
-                "Imaging": ["mri", "ct scan", "x-ray", "cbct"],
-                "Clinical Notes": ["clinical notes", "discharge"],
-            }
-            
-            for modality, keywords in modality_keywords.items():
-                if any(kw in page_text for kw in keywords):
-                    modalities.append(modality)
-            
-            metadata["Physiological_Modality"] = ", ".join(modalities) if modalities else "Not specified"
+            if len(page_text) < MIN_PAGE_TEXT:
+                metadata["Metadata_Completeness"] = "Low"
+                return metadata
             
-            conditions = []
-            condition_keywords = {
-                "Arrhythmia": ["arrhythmia"],
-                "Atrial Fibrillation": ["atrial fibrillation", "afib"],
-                "Heart Failure": ["heart failure"],
-                "Sleep Apnea": ["sleep apnea"],
-                "Hypertension": ["hypertension"],
-                "Pneumonia": ["pneumonia"],
-                "COVID-19": ["covid-19", "sars-cov-2"],
-            }
+            page_lower = page_text.lower()
+            found = _find_keyword_tags(page_lower)
+            modalities = [m for m in _MODALITY_KW if ("modality", m) in found]
+            conditions = [c for c in _CONDITION_KW if ("condition", c) in found]
             
-            for condition, keywords in condition_keywords.items():
-                if any(kw in page_text for kw in keywords):
-                    conditions.append(condition)
+            if modalities:
+                metadata["Physiological_Modality"] = ", ".join(modalities)
+                filled += 1
             
             metadata["Clinical_Condition"] = ", ".join(conditions) if conditions else "General healthy + mixed conditions"
             
             size_info = []
-            subject_match = re.search(r"(\d+)\s*(?:subjects?|patients?)", page_text)
-            if subject_match:
-                size_info.append(f"{subject_match.group(1)} subjects")
+            # Cheap substring pre-checks before running the size regexes
+            if "subject" in page_lower or "patient" in page_lower:
+                subject_match = _SUBJ_RE.search(page_lower)
+                if subject_match:
+                    size_info.append(f"{subject_match.group(1)} subjects")
             
-            duration_match = re.search(r"(\d+)\s*(?:hours?|days?)", page_text)
-            if duration_match:
-                size_info.append(duration_match.group(0))
+            if "hour" in page_lower or "day" in page_lower:
+                duration_match = _DUR_RE.search(page_lower)
+                if duration_match:
+                    size_info.append(duration_match.group(0))
             
-            metadata["Dataset_Size"] = ", ".join(size_info) if size_info else "Not specified"
+            if size_info:
+                metadata["Dataset_Size"] = ", ".join(size_info)
+                filled += 1
             
-            filled_fields = sum(1 for v in metadata.values() if v != "Not specified" and v != [])
-            completeness_ratio = filled_fields / len(metadata)
+            completeness_ratio = filled / TOTAL_FIELDS
             
             if completeness_ratio > 0.7:
                 metadata["Metadata_Completeness"] = "High"
@@ -224,136 +394,161 @@ class PhysioNetExtractor:
 
 extractor = PhysioNetExtractor()
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    return [
-        Tool(
-            name="search_physionet",
-            description="Search for PhysioNet datasets",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string"}
-                },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="get_dataset_metadata",
-            description="Extract metadata from PhysioNet dataset URL",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "url": {"type": "string"}
-                },
-                "required": ["url"]
-            }
-        ),
-        Tool(
-            name="curate_and_save_dataset",
-            description="Fetch, analyze, and save dataset",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "url": {"type": "string"}
-                },
-                "required": ["url"]
-            }
-        ),
-        Tool(
-            name="batch_curate_datasets",
-            description="Curate multiple datasets",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "urls": {"type": "array", "items": {"type": "string"}}
-                },
-                "required": ["urls"]
-            }
-        ),
-        Tool(
-            name="get_database_stats",
-            description="Get statistics about curated datasets",
-            inputSchema={"type": "object", "properties": {}}
-        )
-    ]
+_TOOLS = [
+    Tool(
+        name="search_physionet",
+        description="Search for PhysioNet datasets",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string"}
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="get_dataset_metadata",
+        description="Extract metadata from PhysioNet dataset URL",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "url": {"type": "string"}
+            },
+            "required": ["url"]
+        }
+    ),
+    Tool(
+        name="curate_and_save_dataset",
+        description="Fetch, analyze, and save dataset",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "url": {"type": "string"}
+            },
+            "required": ["url"]
+        }
+    ),
+    Tool(
+        name="batch_curate_datasets",
+        description="Curate multiple datasets",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "urls": {"type": "array", "items": {"type": "string"}}
+            },
+            "required": ["urls"]
+        }
+    ),
+    Tool(
+        name="get_database_stats",
+        description="Get statistics about curated datasets",
+        inputSchema={"type": "object", "properties": {}}
+    )
+]
 
-@app.call_tool()
-async def call_tool(name: str, arguments: Any) -> list[TextContent]:
-    if name == "search_physionet":
-        query = arguments.get("query", "")
-        results = await extractor.search_dataset(query)
-        return [TextContent(type="text", text=json.dumps(results, indent=2))]
+async def _handle_search(arguments: Any) -> list[TextContent]:
+    query = arguments.get("query", "")
+    results = await extractor.search_dataset(query)
+    return [TextContent(type="text", text=json.dumps(results, indent=2))]
+
+async def _handle_get_metadata(arguments: Any) -> list[TextContent]:
+    url = arguments.get("url", "")
+    metadata = await extractor.extract_metadata(url)
+    return [TextContent(type="text", text=json.dumps(metadata, indent=2))]
+
+async def _handle_curate(arguments: Any) -> list[TextContent]:
+    url = arguments.get("url", "")
+    print(f"Curating: {url}", file=sys.stderr)
     
-    elif name == "get_dataset_metadata":
-        url = arguments.get("url", "")
-        metadata = await extractor.extract_metadata(url)
+    metadata = await extractor.extract_metadata(url)
+    if "error" in metadata:
         return [TextContent(type="text", text=json.dumps(metadata, indent=2))]
     
-    elif name == "curate_and_save_dataset":
-        url = arguments.get("url", "")
-        print(f"Curating: {url}", file=sys.stderr)
+    save_result = await extractor.add_to_database(metadata, flush=True)
+    
+    result = {"metadata": metadata, "save_result": save_result}
+    
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+async def _handle_batch_curate(arguments: Any) -> list[TextContent]:
+    urls = arguments.get("urls", [])
+    results = []
+    
+    print(f"Batch curating {len(urls)} datasets...", file=sys.stderr)
+    
+    for i, url in enumerate(urls, 1):
+        print(f"[{i}/{len(urls)}] Processing: {url}", file=sys.stderr)
         
         metadata = await extractor.extract_metadata(url)
-        if "error" in metadata:
-            return [TextContent(type="text", text=json.dumps(metadata, indent=2))]
-        
-        save_result = extractor.save_to_database(metadata)
+        if "error" not in metadata:
+            save_result = await extractor.add_to_database(metadata)
+            results.append({
+                "url": url,
+                "title": metadata.get("Title"),
+                "status": save_result.get("status")
+            })
+        else:
+            results.append({
+                "url": url,
+                "status": "error",
+                "error": metadata.get("error")
+            })
         
-        result = {"metadata": metadata, "save_result": save_result}
-        
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        await asyncio.sleep(2)
     
-    elif name == "batch_curate_datasets":
-        urls = arguments.get("urls", [])
-        results = []
-        
-        print(f"Batch curating {len(urls)} datasets...", file=sys.stderr)
-        
-        for i, url in enumerate(urls, 1):
-            print(f"[{i}/{len(urls)}] Processing: {url}", file=sys.stderr)
-            
-            metadata = await extractor.extract_metadata(url)
-            if "error" not in metadata:
-                save_result = extractor.save_to_database(metadata)
-                results.append({
-                    "url": url,
-                    "title": metadata.get("Title"),
-                    "status": save_result.get("status")
-                })
-            else:
-                results.append({
-                    "url": url,
-                    "status": "error",
-                    "error": metadata.get("error")
-                })
-            
-            await asyncio.sleep(2)
-        
-        summary = {
-            "total": len(urls),
-            "successful": len([r for r in results if r["status"] == "saved"]),
-            "already_exists": len([r for r in results if r["status"] == "exists"]),
-            "failed": len([r for r in results if r["status"] == "error"]),
-            "results": results
-        }
-        
-        return [TextContent(type="text", text=json.dumps(summary, indent=2))]
+    # Write the whole batch to disk once instead of once per URL
+    try:
+        await extractor.flush_database()
+    except Exception as e:
+        print(f"Error saving to database: {e}", file=sys.stderr)
+        for r in results:
+            if r["status"] == "saved":
+                r["status"] = "error"
+                r["error"] = str(e)
     
-    elif name == "get_database_stats":
-        datasets = extractor.load_database()
-        stats = {
-            "total_datasets": len(datasets),
-            "recent_datasets": [
-                {
-                    "title": d.get("Title"),
-                    "year": d.get("Year"),
-                    "curated_date": d.get("curated_date")
-                }
-                for d in datasets[:5]
-            ]
-        }
-        return [TextContent(type="text", text=json.dumps(stats, indent=2))]
+    summary = {
+        "total": len(urls),
+        "successful": len([r for r in results if r["status"] == "saved"]),
+        "already_exists": len([r for r in results if r["status"] == "exists"]),
+        "failed": len([r for r in results if r["status"] == "error"]),
+        "results": results
+    }
+    
+    return [TextContent(type="text", text=json.dumps(summary, indent=2))]
+
+async def _handle_stats(arguments: Any) -> list[TextContent]:
+    datasets = extractor.load_database()
+    stats = {
+        "total_datasets": len(datasets),
+        "recent_datasets": [
+            {
+                "title": d.get("Title"),
+                "year": d.get("Year"),
+                "curated_date": d.get("curated_date")
+            }
+            for d in datasets[:5]
+        ]
+    }
+    return [TextContent(type="text", text=json.dumps(stats, indent=2))]
+
+# Tool name -> handler, built once at import
+_DISPATCH = {
+    "search_physionet": _handle_search,
+    "get_dataset_metadata": _handle_get_metadata,
+    "curate_and_save_dataset": _handle_curate,
+    "batch_curate_datasets": _handle_batch_curate,
+    "get_database_stats": _handle_stats,
+}
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    return _TOOLS
+
+@app.call_tool()
+async def call_tool(name: str, arguments: Any) -> list[TextContent]:
+    handler = _DISPATCH.get(name)
+    if handler:
+        return await handler(arguments)
     
     return [TextContent(type="text", text=json.dumps({"error": "Unknown tool"}))]
 
@@ -366,4 +561,11 @@ async def main():
         await app.run(read_stream, write_stream, app.create_initialization_options())
 
 if __name__ == "__main__":
+    # uvloop is a faster drop-in event loop; it does not support Windows
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
     asyncio.run(main())
\ No newline at end of file
@@ -1,7 +1,10 @@
 import asyncio
+import copy
 import json
 import re
 import os
+import threading
+import time
 from typing import Any, Optional
 from urllib.parse import quote, urljoin
 from datetime import datetime
@@ -23,7 +26,9 @@ if sys.platform == 'win32':
             pass
 
 import httpx
+import orjson
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxhtml
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
@@ -41,37 +46,361 @@ DB_FILE.parent.mkdir(parents=True, exist_ok=True)
 
 PHYSIONET_BASE = "https://physionet.org"
 
+# lxml backs both the BeautifulSoup tree and the XPath lookups below
+HTML_PARSER = "lxml"
+
+# HTTP/2 lets concurrent fetches share one connection; httpx needs the h2 extra for it
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Optional on-disk HTTP cache; PhysioNet landing pages rarely change within a version
+try:
+    import hishel
+except ImportError:
+    hishel = None
+
+HTTP_CACHE_DIR = PROJECT_ROOT / ".http_cache"
+HTTP_CACHE_TTL = 7 * 86400  # seconds
+# Sent on force_refresh so the HTTP cache revalidates with PhysioNet instead of replaying its copy
+_NO_CACHE_HEADERS = {"Cache-Control": "no-cache"}
+
+# Upper bound on concurrent page fetches in extract_metadata_batch
+MAX_CONCURRENT_EXTRACTIONS = 8
+
+# Optional Aho-Corasick automaton for single-pass multi-keyword matching
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Keyword tables used by the extractors (all keywords lowercase, tuples so they stay constant)
+_MODALITY_MAP = {
+    "ECG": ("ecg", "electrocardiogram", "cardiac"),
+    "PCG": ("pcg", "phonocardiogram", "heart sound"),
+    "EEG": ("eeg", "electroencephalogram", "brain activity"),
+    "EMG": ("emg", "electromyogram", "muscle"),
+    "PPG": ("ppg", "photoplethysmogram", "pulse"),
+    "ACC": ("accelerometer", "acceleration"),
+    "Gyroscope": ("gyroscope", "gyro"),
+    "Respiratory": ("respiratory", "respiration", "breathing"),
+    "Blood Pressure": ("blood pressure", "bp", "arterial pressure"),
+    "Temperature": ("temperature", "temp", "thermal"),
+    "Skin Conductance": ("skin conductance", "eda", "electrodermal", "gsr"),
+    "fNIRS": ("fnirs", "near-infrared spectroscopy", "hemodynamic"),
+    "Chest X-ray": ("chest x-ray", "cxr", "radiograph"),
+    "CT": ("ct scan", "computed tomography"),
+    "MRI": ("mri", "magnetic resonance"),
+    "Ultrasound": ("ultrasound", "echocardiogram"),
+    "Clinical Notes": ("clinical notes", "discharge", "radiology report", "ehr"),
+    "Facial Expression": ("facial expression", "face reader"),
+    "Eye Tracking": ("eye tracking", "gaze", "fixation")
+}
+
+_SENSOR_KEYWORDS = ("biopac", "empatica", "nirsport", "facereader", "polar", "fitbit", 
+                    "actiheart", "zephyr", "bioharness")
+
+_FORMAT_KEYWORDS = ("csv", "mat", "hdf5", "edf", "json", "xml", "dicom", "nifti")
+
+# Sensor and format names are single words, so they are matched against the page's
+# word tokens instead of as substrings ("mat" inside "format" is not a MAT file)
+_SENSOR_SET = frozenset(_SENSOR_KEYWORDS)
+_FORMAT_SET = frozenset(_FORMAT_KEYWORDS)
+_PAT_TOKEN = re.compile(r"[a-z0-9]+")
+
+_CONDITION_MAP = {
+    "Arrhythmia": ("arrhythmia", "irregular heartbeat"),
+    "Atrial Fibrillation": ("atrial fibrillation", "afib", "af"),
+    "Heart Failure": ("heart failure", "chf"),
+    "Myocardial Infarction": ("myocardial infarction", "heart attack", "mi"),
+    "Sleep Apnea": ("sleep apnea", "osa", "obstructive sleep"),
+    "Hypertension": ("hypertension", "high blood pressure"),
+    "Pneumonia": ("pneumonia",),
+    "COVID-19": ("covid-19", "sars-cov-2", "coronavirus"),
+    "COPD": ("copd", "chronic obstructive"),
+    "Diabetes": ("diabetes", "diabetic"),
+    "Stroke": ("stroke", "cerebrovascular"),
+    "Sepsis": ("sepsis", "septic"),
+    "Pneumothorax": ("pneumothorax",),
+    "Pleural Effusion": ("pleural effusion",),
+    "Edema": ("edema", "pulmonary edema"),
+    "Cardiomegaly": ("cardiomegaly", "enlarged heart"),
+    "Atelectasis": ("atelectasis",),
+    "Consolidation": ("consolidation",)
+}
+
+_POPULATION_KEYWORDS = {
+    "ICU patients": ("intensive care", "icu", "critical care"),
+    "Emergency department": ("emergency", "ed visits"),
+    "Inpatients": ("inpatient", "hospitalized"),
+    "Outpatients": ("outpatient", "ambulatory"),
+    "Healthy volunteers": ("healthy", "volunteer", "normal subjects"),
+    "Neonatal": ("neonatal", "newborn", "infant"),
+    "Pediatric": ("pediatric", "children"),
+    "Geriatric": ("geriatric", "elderly", "older adults")
+}
+
+_SETTING_KEYWORDS = {
+    "Hospital": ("hospital", "medical center"),
+    "Laboratory": ("laboratory", "lab setting", "controlled environment"),
+    "Home": ("home", "ambulatory", "real-world"),
+    "Clinic": ("clinic", "outpatient")
+}
+
+_APPLICATION_KEYWORDS = {
+    "Classification": ("classification", "detection", "diagnosis"),
+    "Segmentation": ("segmentation", "localization"),
+    "Prediction": ("prediction", "prognosis", "forecasting"),
+    "Generation": ("generation", "synthesis", "report generation"),
+    "Question Answering": ("question answering", "vqa", "qa"),
+    "Summarization": ("summarization", "summarize"),
+    "Entity Recognition": ("entity recognition", "ner", "named entity"),
+    "Signal Processing": ("signal processing", "filtering", "feature extraction"),
+    "Deep Learning": ("deep learning", "neural network", "cnn", "rnn"),
+    "Transfer Learning": ("transfer learning", "pre-training"),
+    "Explainable AI": ("explainable", "interpretable", "xai"),
+    "Multimodal Learning": ("multimodal", "multi-modal", "fusion"),
+    "Time Series": ("time series", "temporal", "sequential"),
+    "Anomaly Detection": ("anomaly detection", "outlier")
+}
+
+_FUNDING_KEYWORDS = ("nsf", "nih", "national science foundation", "national institutes of health", 
+                     "funded by", "supported by", "grant")
+
+def _build_keyword_index() -> dict[str, list[tuple[str, str]]]:
+    """Map every keyword to the (category, canonical_name) tags it signals"""
+    index: dict[str, list[tuple[str, str]]] = {}
+    
+    def add(category: str, name: str, keywords):
+        for kw in keywords:
+            index.setdefault(kw, []).append((category, name))
+    
+    for category, table in (("modality", _MODALITY_MAP), ("condition", _CONDITION_MAP),
+                            ("population", _POPULATION_KEYWORDS), ("setting", _SETTING_KEYWORDS),
+                            ("application", _APPLICATION_KEYWORDS)):
+        for name, keywords in table.items():
+            add(category, name, keywords)
+    for keyword in _FUNDING_KEYWORDS:
+        add("funding", keyword, [keyword])
+    
+    return index
+
+_KEYWORD_INDEX = _build_keyword_index()
+# UTF-8 keywords for the substring fallback when the automaton isn't available
+_KEYWORD_INDEX_BYTES = tuple((kw.encode("utf-8"), tags) for kw, tags in _KEYWORD_INDEX.items())
+
+# Precompiled patterns (compiled once at import instead of on every extraction)
+_HREF_CONTENT = re.compile(r"/content/[^/]+/[^/]+")
+_HREF_FILES = re.compile(r"/files/")
+_HREF_LICENSE = re.compile(r"license", re.I)
+
+_PAT_YEAR = re.compile(r"(19|20)\d{2}")
+_PAT_VERSION_NUMBER = re.compile(r"(\d+\.\d+\.\d+)")
+
+_PAT_AUTHOR = re.compile(r"author", re.I)
+_PAT_CORR_NAME = re.compile(r":\s*([^<\n]+)")
+
+_PAT_SIZE_COMPRESSED = re.compile(r"(\d+\.?\d*\s*(?:KB|MB|GB|TB)).*compressed", re.I)
+_PAT_SIZE_UNCOMPRESSED = re.compile(r"(\d+\.?\d*\s*(?:KB|MB|GB|TB)).*uncompressed", re.I)
+
+_PAT_IRB = re.compile(r"IRB[:\s#]*([A-Z0-9\-]+)", re.I)
+_PAT_APPROVAL = re.compile(r"approved by[^.]+", re.I)
+_PAT_GRANT = re.compile(r"grant[s]?[:\s#]*([A-Z0-9\-/]+)", re.I)
+
+_PAT_CITATION = re.compile(r"citation", re.I)
+
+_PAT_SAMPLING_RATE = re.compile(r"(\d+\.?\d*)\s*(?:Hz|khz|samples?/s)", re.I)
+
+# Dataset characteristics; where a field has two patterns they are tried in order
+# and the first that matches wins
+_PAT_SUBJECTS = (
+    re.compile(r"(\d+)\s*(?:subjects?|patients?|participants?|individuals?)"),
+    re.compile(r"total\s+(?:of\s+)?(\d+)\s*(?:subjects?|patients?)")
+)
+_PAT_RECORDINGS = re.compile(r"(\d+[\,\d]*)\s*(?:recordings?|studies|exams?)")
+_PAT_DURATION = (
+    re.compile(r"(\d+\.?\d*)\s*(?:hours?|hrs?)\s*(?:per|of|each)"),
+    re.compile(r"duration[:\s]+(\d+\.?\d*)\s*(?:minutes?|hours?|days?)")
+)
+_PAT_AGE = re.compile(r"age[sd]?[:\s]+(\d+[-–to\s]+\d+)")
+_PAT_GENDER = re.compile(r"(\d+)\s*(?:male|female)")
+# Matched against the original text, not the lowercased copy: "to" is case-sensitive here
+_PAT_PERIOD = re.compile(r"(19|20)\d{2}[-–to\s]+(19|20)\d{2}")
+
+_PAT_LIMITATION_ID = re.compile(r"limitation", re.I)
+_PAT_LIMIT_SPLIT = re.compile(r'[.\n•]')
+# XPath lookups that replace BeautifulSoup's find(string=...) full-tree walks
+_EXSLT_NS = {"re": "http://exslt.org/regular-expressions"}
+_XP_VERSION_TEXT = etree.XPath(r"//text()[re:test(., 'Version:?\s*\d+\.\d+\.\d+', 'i')]", namespaces=_EXSLT_NS)
+_XP_PUB_TEXT = etree.XPath(r"//text()[re:test(., 'Published:?\s*\w+\.?\s+\d+,?\s+\d{4}', 'i')]", namespaces=_EXSLT_NS)
+_XP_DOI_LINKS = etree.XPath("//a[contains(@href, 'doi.org')]")
+_XP_CORR_AUTHOR_TEXT = etree.XPath(r"//text()[re:test(., 'Corresponding Author', 'i')]", namespaces=_EXSLT_NS)
+# Parent of the first matching <h2>, i.e. the section the heading introduces. The
+# (...)[1] matters: //h2/.. alone yields parents in document order, so an outer
+# <body> parent of a later heading would come before the first heading's <div>
+_XP_ETHICS_PARENT = etree.XPath(r"(//h2[re:test(., 'Ethics', 'i')])[1]/..", namespaces=_EXSLT_NS)
+_XP_REFERENCES_PARENT = etree.XPath(r"(//h2[re:test(., 'References', 'i')])[1]/..", namespaces=_EXSLT_NS)
+_XP_LIMITATIONS_PARENT = etree.XPath(r"(//h2[re:test(., 'Limitations?', 'i')])[1]/..", namespaces=_EXSLT_NS)
+
+# Elements whose text is code, not page content; BeautifulSoup's get_text() skips them too
+_NON_TEXT_TAGS = ("script", "style", "template")
+
+def _parse_tree(content: bytes, encoding: Optional[str] = None):
+    """lxml tree for the XPath lookups and page text; blank pages get an empty <html> so lookups just miss"""
+    # Without an explicit encoding lxml only honours <meta charset> and falls back to Latin-1
+    try:
+        parser = lxhtml.HTMLParser(encoding=encoding) if encoding else None
+    except LookupError:
+        parser = None
+    try:
+        tree = lxhtml.document_fromstring(content, parser=parser)
+    except etree.ParserError:
+        return lxhtml.Element("html")
+    etree.strip_elements(tree, *_NON_TEXT_TAGS, with_tail=False)
+    return tree
+
+def _tree_from_soup(soup: BeautifulSoup):
+    """lxml tree re-parsed from soup, for callers that didn't pass one in"""
+    return _parse_tree(soup.encode("utf-8"), "utf-8")
+
+def _text_parent(text):
+    """Element containing an lxml text-node result (tail text belongs to the outer element)"""
+    parent = text.getparent()
+    return parent.getparent() if text.is_tail else parent
+
+# Common limitation phrases. Each is searched bare (and case-sensitively, the text is
+# lowercased) first; only a hit is widened to its sentence, so pages without the
+# phrase never pay for the [^.]* backtracking.
+_PAT_LIMITATION_PHRASES = tuple(
+    (re.compile(pattern), re.compile(f"[^.]*{pattern}[^.]*", re.I))
+    for pattern in (
+        r"small sample size",
+        r"limited to.*institution",
+        r"no control group",
+        r"imbalanced",
+        r"single center",
+        r"retrospective"
+    )
+)
+
 class EnhancedPhysioNetExtractor:
     """Enhanced intelligent extraction and structuring of PhysioNet dataset metadata"""
     
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=60.0, follow_redirects=True)
+        client_kwargs = dict(
+            timeout=60.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+            http2=HTTP2_AVAILABLE,
+        )
+        if hishel is not None:
+            # Serves fresh pages from disk and revalidates stale ones with a conditional GET
+            storage = hishel.AsyncFileStorage(base_path=HTTP_CACHE_DIR, ttl=HTTP_CACHE_TTL)
+            controller = hishel.Controller(allow_heuristics=True)
+            self.client = hishel.AsyncCacheClient(storage=storage, controller=controller, **client_kwargs)
+        else:
+            self.client = httpx.AsyncClient(**client_kwargs)
+        self._automaton = self._build_automaton()
+        # In-memory copy of DB_FILE, oldest first so new entries are appended;
+        # the file itself stays newest first. Reloaded whenever the file's mtime changes.
+        self._datasets: list[dict] | None = None
+        self._db_mtime: float | None = None
+        # Every save bumps _save_seq; _written_seq is the newest save that reached DB_FILE
+        self._save_seq = 0
+        self._written_seq = 0
+        # Writes happen both inline and from flush()'s worker thread
+        self._file_lock = threading.Lock()
+        # Set once anything has been written; close() fsyncs the file a single time
+        self._needs_fsync = False
+        # Dataset_URL -> position in self._datasets
+        self._url_index: dict[str, int] = {}
+        # Highest id handed out or loaded, so ids stay unique within the same millisecond
+        self._last_id = 0
     
     async def close(self):
-        await self.client.aclose()
+        try:
+            await self.flush()
+            if self._needs_fsync:
+                await asyncio.to_thread(self._fsync_database)
+                self._needs_fsync = False
+        finally:
+            await self.client.aclose()
+    
+    def _build_automaton(self):
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for kw, tags in _KEYWORD_INDEX.items():
+            automaton.add_word(kw, tags)
+        automaton.make_automaton()
+        return automaton
+    
+    def scan_keywords(self, page_text_lower: str) -> dict[str, set[str]]:
+        """Find every keyword in one pass, grouped as {category: {canonical_name}}"""
+        hits: dict[str, set[str]] = {}
+        if self._automaton is not None:
+            for _, tags in self._automaton.iter(page_text_lower):
+                for category, name in tags:
+                    hits.setdefault(category, set()).add(name)
+        else:
+            # Encode once so pages with any non-Latin-1 character are scanned at 1 byte per
+            # ASCII char rather than PyUnicode's 2- or 4-byte representation
+            page_bytes = page_text_lower.encode("utf-8", errors="ignore")
+            for kw, tags in _KEYWORD_INDEX_BYTES:
+                if kw in page_bytes:
+                    for category, name in tags:
+                        hits.setdefault(category, set()).add(name)
+        return hits
     
     def load_database(self) -> list[dict]:
-        if DB_FILE.exists():
+        """All curated datasets, newest first (the order of DB_FILE)"""
+        return self._load_datasets()[::-1]
+    
+    def _load_datasets(self) -> list[dict]:
+        # Unflushed saves only exist in memory, so never reload over them
+        if self._datasets is not None and self._save_seq != self._written_seq:
+            return self._datasets
+        try:
+            mtime = DB_FILE.stat().st_mtime
+        except FileNotFoundError:
+            mtime = None
+        # server.py writes the same file, so only trust the cache while the file is unchanged
+        if self._datasets is not None and mtime == self._db_mtime:
+            return self._datasets
+        
+        datasets = []
+        if mtime is not None:
             try:
-                with open(DB_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(DB_FILE, 'rb') as f:
+                    datasets = orjson.loads(f.read())
             except Exception as e:
                 print(f"Error loading database: {e}", file=sys.stderr)
-                return []
-        return []
+                datasets = []
+        datasets.reverse()
+        self._datasets = datasets
+        self._db_mtime = mtime
+        # Later positions are nearer the top of the file, so they win for duplicate URLs
+        self._url_index = {}
+        for i, d in enumerate(datasets):
+            url = d.get('Dataset_URL')
+            if url:
+                self._url_index[url] = i
+        self._last_id = max(self._last_id,
+                            max((d['id'] for d in datasets if isinstance(d.get('id'), int)), default=0))
+        return datasets
     
-    def save_to_database(self, metadata: dict) -> dict:
+    def save_to_database(self, metadata: dict, flush: bool = True) -> dict:
+        """Insert or update a dataset; with flush=False the write waits for flush()"""
         try:
-            datasets = self.load_database()
-            metadata['id'] = int(datetime.now().timestamp() * 1000)
+            datasets = self._load_datasets()
+            metadata['id'] = self._next_id()
             metadata['curated_date'] = datetime.now().isoformat()
             
             # Check for existing URL and update if found
-            existing_index = None
-            for i, d in enumerate(datasets):
-                if d.get('Dataset_URL') == metadata.get('Dataset_URL'):
-                    existing_index = i
-                    break
+            url = metadata.get('Dataset_URL')
+            existing_index = self._url_index.get(url)
             
             if existing_index is not None:
                 # Update existing entry
@@ -79,13 +408,16 @@ class EnhancedPhysioNetExtractor:
                 print(f"Updated existing dataset: {metadata.get('Title')}", file=sys.stderr)
                 status_msg = {"status": "updated", "message": "Dataset updated in database"}
             else:
-                # Add new entry
-                datasets.insert(0, metadata)
+                # Add new entry (appended in memory, written at the top of the file)
+                datasets.append(metadata)
+                if url:
+                    self._url_index[url] = len(datasets) - 1
                 print(f"Saved to database: {metadata.get('Title')}", file=sys.stderr)
                 status_msg = {"status": "saved", "message": f"Successfully saved. Total datasets: {len(datasets)}"}
             
-            with open(DB_FILE, 'w', encoding='utf-8') as f:
-                json.dump(datasets, f, indent=2, ensure_ascii=False)
+            self._save_seq += 1
+            if flush:
+                self._write_datasets()
             
             print(f"Total datasets: {len(datasets)}", file=sys.stderr)
             
@@ -96,6 +428,68 @@ class EnhancedPhysioNetExtractor:
             print(f"Error saving to database: {e}", file=sys.stderr)
             return {"status": "error", "message": str(e)}
     
+    def _next_id(self) -> int:
+        """Millisecond timestamp id, bumped past the last one if saves land in the same ms"""
+        self._last_id = max(self._last_id + 1, time.time_ns() // 1_000_000)
+        return self._last_id
+    
+    def _write_database(self):
+        # Snapshot under the lock so a later write can never be overtaken by an older snapshot
+        with self._file_lock:
+            seq = self._save_seq
+            datasets = self._datasets[::-1]
+            # Write to a temp file and swap it in so readers never see a half-written file.
+            # No fsync here: forcing every flush to disk is the expensive part, close() does it once.
+            tmp = DB_FILE.with_suffix(".json.tmp")
+            with open(tmp, 'wb') as f:
+                f.write(orjson.dumps(datasets, option=orjson.OPT_INDENT_2))
+            os.replace(tmp, DB_FILE)
+            self._written_seq = max(self._written_seq, seq)
+            self._db_mtime = DB_FILE.stat().st_mtime
+            self._needs_fsync = True
+    
+    def _write_datasets(self):
+        """Write the in-memory datasets to DB_FILE now, dropping the cache if that fails"""
+        try:
+            self._write_database()
+        except Exception:
+            self._drop_cache()
+            raise
+    
+    def _drop_cache(self):
+        # Force a reload so the cache never drifts from what is on disk
+        self._datasets = None
+        self._written_seq = self._save_seq
+    
+    def _fsync_database(self):
+        with self._file_lock:
+            # Windows only flushes handles opened for writing
+            fd = os.open(DB_FILE, os.O_RDWR)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            # The os.replace() renames are only durable once the directory entry is synced too
+            if sys.platform != "win32":
+                fd = os.open(DB_FILE.parent, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+    
+    async def flush(self):
+        """Write pending saves to DB_FILE in a single atomic write"""
+        if self._datasets is None or self._save_seq == self._written_seq:
+            return
+        try:
+            count = len(self._datasets)
+            await asyncio.to_thread(self._write_database)
+            print(f"Flushed {count} datasets to {DB_FILE}", file=sys.stderr)
+        except Exception as e:
+            print(f"Error flushing database: {e}", file=sys.stderr)
+            self._drop_cache()
+            raise
+    
     async def search_dataset(self, query: str) -> list[dict]:
         if query.startswith("http"):
             return [{"title": "Direct URL", "url": query}]
@@ -105,24 +499,30 @@ class EnhancedPhysioNetExtractor:
             response = await self.client.get(search_url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             results = []
+            seen: set[str] = set()
             
-            for link in soup.find_all("a", href=re.compile(r"/content/[^/]+/[^/]+")):
+            for link in soup.find_all("a", href=_HREF_CONTENT):
                 href = link.get("href")
                 if href and "/content/" in href:
                     full_url = f"{PHYSIONET_BASE}{href}" if href.startswith("/") else href
                     title = link.get_text(strip=True)
-                    if title and full_url not in [r["url"] for r in results]:
+                    if title and full_url not in seen:
+                        seen.add(full_url)
                         results.append({"title": title, "url": full_url})
+                        if len(results) >= 5:
+                            break
             
-            return results[:5]
+            return results
             
         except Exception as e:
             return [{"error": f"Search failed: {str(e)}"}]
     
-    def extract_version_and_doi(self, soup: BeautifulSoup) -> dict:
+    def extract_version_and_doi(self, soup: BeautifulSoup, *, tree=None) -> dict:
         """Extract version, DOI, and publication date information"""
+        if tree is None:
+            tree = _tree_from_soup(soup)
         info = {
             "version": "Not specified",
             "published_date": "Not specified",
@@ -131,48 +531,49 @@ class EnhancedPhysioNetExtractor:
         }
         
         # Look for version info
-        version_text = soup.find(string=re.compile(r"Version:?\s*\d+\.\d+\.\d+", re.I))
+        version_text = _XP_VERSION_TEXT(tree)
         if version_text:
-            version_match = re.search(r"(\d+\.\d+\.\d+)", str(version_text))
+            version_match = _PAT_VERSION_NUMBER.search(version_text[0])
             if version_match:
                 info["version"] = version_match.group(1)
         
         # Look for published date
-        pub_text = soup.find(string=re.compile(r"Published:?\s*\w+\.?\s+\d+,?\s+\d{4}", re.I))
+        pub_text = _XP_PUB_TEXT(tree)
         if pub_text:
-            info["published_date"] = pub_text.strip()
+            info["published_date"] = pub_text[0].strip()
         
         # Extract DOIs
-        doi_links = soup.find_all("a", href=re.compile(r"doi\.org"))
-        for link in doi_links:
+        for link in _XP_DOI_LINKS(tree):
             doi_url = link.get("href", "")
-            if "doi.org" in doi_url:
-                if "version" in link.get_text().lower():
-                    info["doi_version"] = doi_url
-                elif "latest" in link.get_text().lower():
-                    info["doi_latest"] = doi_url
+            link_text = link.text_content().lower()
+            if "version" in link_text:
+                info["doi_version"] = doi_url
+            elif "latest" in link_text:
+                info["doi_latest"] = doi_url
         
         return info
     
-    def extract_authors_and_affiliations(self, soup: BeautifulSoup) -> dict:
+    def extract_authors_and_affiliations(self, soup: BeautifulSoup, *, tree=None) -> dict:
         """Extract author information and affiliations"""
+        if tree is None:
+            tree = _tree_from_soup(soup)
         authors = []
         corresponding_author = "Not specified"
         
         # Look for author elements
-        author_section = soup.find("div", class_=re.compile(r"author", re.I)) or \
-                        soup.find("section", id=re.compile(r"author", re.I))
+        author_section = soup.find("div", class_=_PAT_AUTHOR) or \
+                        soup.find("section", id=_PAT_AUTHOR)
         
         if author_section:
             author_links = author_section.find_all("a")
-            authors = [a.get_text(strip=True) for a in author_links if a.get_text(strip=True)]
+            authors = [name for name in (a.get_text(strip=True) for a in author_links) if name]
         
         # Look for corresponding author
-        corr_text = soup.find(string=re.compile(r"Corresponding Author", re.I))
+        corr_text = _XP_CORR_AUTHOR_TEXT(tree)
         if corr_text:
-            parent = corr_text.find_parent()
-            if parent:
-                corr_match = re.search(r":\s*([^<\n]+)", parent.get_text())
+            parent = _text_parent(corr_text[0])
+            if parent is not None:
+                corr_match = _PAT_CORR_NAME.search(parent.text_content())
                 if corr_match:
                     corresponding_author = corr_match.group(1).strip()
         
@@ -181,7 +582,7 @@ class EnhancedPhysioNetExtractor:
             "corresponding_author": corresponding_author
         }
     
-    def extract_file_structure(self, soup: BeautifulSoup) -> dict:
+    def extract_file_structure(self, soup: BeautifulSoup, page_text: Optional[str] = None) -> dict:
         """Extract information about dataset files and structure"""
         file_info = {
             "total_size_compressed": "Not specified",
@@ -190,28 +591,33 @@ class EnhancedPhysioNetExtractor:
             "main_folders": []
         }
         
-        # Look for size information
-        size_text = soup.get_text()
+        # Look for size information; reuse the page text extract_metadata already has
+        size_text = page_text if page_text is not None else soup.get_text()
         
-        compressed_match = re.search(r"(\d+\.?\d*\s*(?:KB|MB|GB|TB)).*compressed", size_text, re.I)
+        compressed_match = _PAT_SIZE_COMPRESSED.search(size_text)
         if compressed_match:
             file_info["total_size_compressed"] = compressed_match.group(1)
         
-        uncompressed_match = re.search(r"(\d+\.?\d*\s*(?:KB|MB|GB|TB)).*uncompressed", size_text, re.I)
+        uncompressed_match = _PAT_SIZE_UNCOMPRESSED.search(size_text)
         if uncompressed_match:
             file_info["total_size_uncompressed"] = uncompressed_match.group(1)
         
         # Look for file structure information
         file_section = soup.find("section", id="files") or soup.find("div", id="files")
         if file_section:
-            folder_items = file_section.find_all("a", href=re.compile(r"/files/"))
+            folder_items = file_section.find_all("a", href=_HREF_FILES)
             folders = [item.get_text(strip=True) for item in folder_items[:10]]  # Top 10 folders
             file_info["main_folders"] = folders if folders else []
         
         return file_info
     
-    def extract_ethics_and_funding(self, soup: BeautifulSoup, page_text: str) -> dict:
+    def extract_ethics_and_funding(self, soup: BeautifulSoup, page_text: str,
+                                   *, page_text_lower: Optional[str] = None, hits: Optional[dict] = None, tree=None) -> dict:
         """Extract ethics approval and funding information"""
+        if page_text_lower is None:
+            page_text_lower = page_text.lower()
+        if hits is None:
+            hits = self.scan_keywords(page_text_lower)
         ethics_funding = {
             "ethics_approval": "Not specified",
             "irb_number": "Not specified",
@@ -219,36 +625,39 @@ class EnhancedPhysioNetExtractor:
         }
         
         # Look for ethics/IRB information
-        ethics_section = soup.find("section", id="ethics") or soup.find("h2", string=re.compile(r"Ethics", re.I))
+        ethics_text = None
+        ethics_section = soup.find("section", id="ethics")
         if ethics_section:
-            ethics_text = ethics_section.find_parent().get_text() if ethics_section.name == "h2" else ethics_section.get_text()
-            
+            ethics_text = ethics_section.get_text()
+        else:
+            if tree is None:
+                tree = _tree_from_soup(soup)
+            ethics_parent = _XP_ETHICS_PARENT(tree)
+            if ethics_parent:
+                ethics_text = ethics_parent[0].text_content()
+        
+        if ethics_text is not None:
             # Extract IRB number
-            irb_match = re.search(r"IRB[:\s#]*([A-Z0-9\-]+)", ethics_text, re.I)
+            irb_match = _PAT_IRB.search(ethics_text)
             if irb_match:
                 ethics_funding["irb_number"] = irb_match.group(1)
             
             # Extract approval text
-            approval_match = re.search(r"approved by[^.]+", ethics_text, re.I)
+            approval_match = _PAT_APPROVAL.search(ethics_text)
             if approval_match:
                 ethics_funding["ethics_approval"] = approval_match.group(0)
         
-        # Look for funding information
-        funding_keywords = ["NSF", "NIH", "National Science Foundation", "National Institutes of Health", 
-                           "funded by", "supported by", "grant"]
-        
-        for keyword in funding_keywords:
-            if keyword.lower() in page_text.lower():
-                # Extract grant numbers
-                grant_matches = re.findall(r"grant[s]?[:\s#]*([A-Z0-9\-/]+)", page_text, re.I)
-                ethics_funding["funding_sources"].extend(grant_matches[:5])
+        # Look for funding information; the grant numbers don't depend on which keyword hit
+        if hits.get("funding"):
+            grant_matches = _PAT_GRANT.findall(page_text)
+            ethics_funding["funding_sources"].extend(grant_matches[:5])
         
         # Remove duplicates
         ethics_funding["funding_sources"] = list(set(ethics_funding["funding_sources"]))
         
         return ethics_funding
     
-    def extract_citations_and_references(self, soup: BeautifulSoup) -> dict:
+    def extract_citations_and_references(self, soup: BeautifulSoup, *, tree=None) -> dict:
         """Extract citation information and related publications"""
         citations = {
             "primary_citation": "Not specified",
@@ -257,22 +666,39 @@ class EnhancedPhysioNetExtractor:
         }
         
         # Look for citation section
-        citation_section = soup.find("section", id="citation") or soup.find("div", class_=re.compile(r"citation", re.I))
+        citation_section = soup.find("section", id="citation") or soup.find("div", class_=_PAT_CITATION)
         if citation_section:
             cite_text = citation_section.get_text()
             citations["primary_citation"] = " ".join(cite_text.split()[:100])
         
         # Look for references section
-        refs_section = soup.find("section", id="references") or soup.find("h2", string=re.compile(r"References", re.I))
+        refs_section = soup.find("section", id="references")
         if refs_section:
-            ref_parent = refs_section.find_parent() if refs_section.name == "h2" else refs_section
-            ref_items = ref_parent.find_all("li")[:5]  # First 5 references
+            ref_items = refs_section.find_all("li")[:5]  # First 5 references
             citations["related_publications"] = [item.get_text(strip=True) for item in ref_items]
+        else:
+            if tree is None:
+                tree = _tree_from_soup(soup)
+            ref_parent = _XP_REFERENCES_PARENT(tree)
+            if ref_parent:
+                ref_items = list(ref_parent[0].iter("li"))[:5]
+                # Same normalisation as get_text(strip=True): strip each text piece, then join
+                citations["related_publications"] = [
+                    "".join(piece.strip() for piece in item.itertext()) for item in ref_items
+                ]
         
         return citations
     
-    def extract_detailed_modalities(self, page_text: str, soup: BeautifulSoup) -> dict:
+    def extract_detailed_modalities(self, page_text: str, soup: BeautifulSoup,
+                                    *, page_text_lower: Optional[str] = None, hits: Optional[dict] = None,
+                                    tokens: Optional[frozenset[str]] = None) -> dict:
         """Enhanced modality extraction with detailed information"""
+        if page_text_lower is None:
+            page_text_lower = page_text.lower()
+        if hits is None:
+            hits = self.scan_keywords(page_text_lower)
+        if tokens is None:
+            tokens = frozenset(_PAT_TOKEN.findall(page_text_lower))
         modality_details = {
             "modalities": [],
             "sensors_used": [],
@@ -280,53 +706,30 @@ class EnhancedPhysioNetExtractor:
             "data_formats": []
         }
         
-        modality_map = {
-            "ECG": ["ecg", "electrocardiogram", "cardiac"],
-            "PCG": ["pcg", "phonocardiogram", "heart sound"],
-            "EEG": ["eeg", "electroencephalogram", "brain activity"],
-            "EMG": ["emg", "electromyogram", "muscle"],
-            "PPG": ["ppg", "photoplethysmogram", "pulse"],
-            "ACC": ["accelerometer", "acceleration"],
-            "Gyroscope": ["gyroscope", "gyro"],
-            "Respiratory": ["respiratory", "respiration", "breathing"],
-            "Blood Pressure": ["blood pressure", "bp", "arterial pressure"],
-            "Temperature": ["temperature", "temp", "thermal"],
-            "Skin Conductance": ["skin conductance", "eda", "electrodermal", "gsr"],
-            "fNIRS": ["fnirs", "near-infrared spectroscopy", "hemodynamic"],
-            "Chest X-ray": ["chest x-ray", "cxr", "radiograph"],
-            "CT": ["ct scan", "computed tomography"],
-            "MRI": ["mri", "magnetic resonance"],
-            "Ultrasound": ["ultrasound", "echocardiogram"],
-            "Clinical Notes": ["clinical notes", "discharge", "radiology report", "ehr"],
-            "Facial Expression": ["facial expression", "face reader"],
-            "Eye Tracking": ["eye tracking", "gaze", "fixation"]
-        }
-        
-        for modality, keywords in modality_map.items():
-            if any(kw in page_text.lower() for kw in keywords):
-                modality_details["modalities"].append(modality)
+        found = hits.get("modality", ())
+        modality_details["modalities"] = [m for m in _MODALITY_MAP if m in found]
         
         # Extract sensor information
-        sensor_keywords = ["biopac", "empatica", "nirsport", "facereader", "polar", "fitbit", 
-                          "actiheart", "zephyr", "bioharness"]
-        for sensor in sensor_keywords:
-            if sensor in page_text.lower():
-                modality_details["sensors_used"].append(sensor.title())
+        found = tokens & _SENSOR_SET
+        modality_details["sensors_used"] = [s.title() for s in _SENSOR_KEYWORDS if s in found]
         
         # Extract sampling rates
-        rate_matches = re.findall(r"(\d+\.?\d*)\s*(?:Hz|khz|samples?/s)", page_text, re.I)
+        rate_matches = _PAT_SAMPLING_RATE.findall(page_text)
         modality_details["sampling_rates"] = list(set(rate_matches[:5]))
         
         # Extract data formats
-        format_keywords = ["csv", "mat", "hdf5", "edf", "json", "xml", "dicom", "nifti"]
-        for fmt in format_keywords:
-            if fmt in page_text.lower():
-                modality_details["data_formats"].append(fmt.upper())
+        found = tokens & _FORMAT_SET
+        modality_details["data_formats"] = [f.upper() for f in _FORMAT_KEYWORDS if f in found]
         
         return modality_details
     
-    def extract_clinical_context(self, page_text: str, soup: BeautifulSoup) -> dict:
+    def extract_clinical_context(self, page_text: str, soup: BeautifulSoup,
+                                 *, page_text_lower: Optional[str] = None, hits: Optional[dict] = None) -> dict:
         """Extract detailed clinical context and conditions"""
+        if page_text_lower is None:
+            page_text_lower = page_text.lower()
+        if hits is None:
+            hits = self.scan_keywords(page_text_lower)
         clinical = {
             "conditions": [],
             "patient_population": "Not specified",
@@ -336,65 +739,30 @@ class EnhancedPhysioNetExtractor:
         }
         
         # Enhanced condition detection
-        condition_map = {
-            "Arrhythmia": ["arrhythmia", "irregular heartbeat"],
-            "Atrial Fibrillation": ["atrial fibrillation", "afib", "af"],
-            "Heart Failure": ["heart failure", "chf"],
-            "Myocardial Infarction": ["myocardial infarction", "heart attack", "mi"],
-            "Sleep Apnea": ["sleep apnea", "osa", "obstructive sleep"],
-            "Hypertension": ["hypertension", "high blood pressure"],
-            "Pneumonia": ["pneumonia"],
-            "COVID-19": ["covid-19", "sars-cov-2", "coronavirus"],
-            "COPD": ["copd", "chronic obstructive"],
-            "Diabetes": ["diabetes", "diabetic"],
-            "Stroke": ["stroke", "cerebrovascular"],
-            "Sepsis": ["sepsis", "septic"],
-            "Pneumothorax": ["pneumothorax"],
-            "Pleural Effusion": ["pleural effusion"],
-            "Edema": ["edema", "pulmonary edema"],
-            "Cardiomegaly": ["cardiomegaly", "enlarged heart"],
-            "Atelectasis": ["atelectasis"],
-            "Consolidation": ["consolidation"]
-        }
-        
-        for condition, keywords in condition_map.items():
-            if any(kw in page_text.lower() for kw in keywords):
-                clinical["conditions"].append(condition)
-        
-        # Extract population type
-        pop_keywords = {
-            "ICU patients": ["intensive care", "icu", "critical care"],
-            "Emergency department": ["emergency", "ed visits"],
-            "Inpatients": ["inpatient", "hospitalized"],
-            "Outpatients": ["outpatient", "ambulatory"],
-            "Healthy volunteers": ["healthy", "volunteer", "normal subjects"],
-            "Neonatal": ["neonatal", "newborn", "infant"],
-            "Pediatric": ["pediatric", "children"],
-            "Geriatric": ["geriatric", "elderly", "older adults"]
-        }
+        found = hits.get("condition", ())
+        clinical["conditions"] = [c for c in _CONDITION_MAP if c in found]
         
-        for pop_type, keywords in pop_keywords.items():
-            if any(kw in page_text.lower() for kw in keywords):
+        # Extract population type (first match in table order wins)
+        found = hits.get("population", ())
+        for pop_type in _POPULATION_KEYWORDS:
+            if pop_type in found:
                 clinical["patient_population"] = pop_type
                 break
         
         # Extract clinical setting
-        setting_keywords = {
-            "Hospital": ["hospital", "medical center"],
-            "Laboratory": ["laboratory", "lab setting", "controlled environment"],
-            "Home": ["home", "ambulatory", "real-world"],
-            "Clinic": ["clinic", "outpatient"]
-        }
-        
-        for setting, keywords in setting_keywords.items():
-            if any(kw in page_text.lower() for kw in keywords):
+        found = hits.get("setting", ())
+        for setting in _SETTING_KEYWORDS:
+            if setting in found:
                 clinical["clinical_setting"] = setting
                 break
         
         return clinical
     
-    def extract_dataset_characteristics(self, page_text: str, soup: BeautifulSoup) -> dict:
+    def extract_dataset_characteristics(self, page_text: str, soup: BeautifulSoup,
+                                        *, page_text_lower: Optional[str] = None) -> dict:
         """Extract comprehensive dataset size and characteristics"""
+        if page_text_lower is None:
+            page_text_lower = page_text.lower()
         characteristics = {
             "num_subjects": "Not specified",
             "num_recordings": "Not specified",
@@ -406,114 +774,93 @@ class EnhancedPhysioNetExtractor:
         }
         
         # Extract number of subjects/patients
-        subject_patterns = [
-            r"(\d+)\s*(?:subjects?|patients?|participants?|individuals?)",
-            r"total\s+(?:of\s+)?(\d+)\s*(?:subjects?|patients?)"
-        ]
-        
-        for pattern in subject_patterns:
-            match = re.search(pattern, page_text.lower())
+        for pattern in _PAT_SUBJECTS:
+            match = pattern.search(page_text_lower)
             if match:
                 characteristics["num_subjects"] = match.group(1)
                 break
         
         # Extract number of recordings/studies
-        recording_match = re.search(r"(\d+[\,\d]*)\s*(?:recordings?|studies|exams?)", page_text.lower())
+        recording_match = _PAT_RECORDINGS.search(page_text_lower)
         if recording_match:
             characteristics["num_recordings"] = recording_match.group(1).replace(",", "")
         
         # Extract duration information
-        duration_patterns = [
-            r"(\d+\.?\d*)\s*(?:hours?|hrs?)\s*(?:per|of|each)",
-            r"duration[:\s]+(\d+\.?\d*)\s*(?:minutes?|hours?|days?)"
-        ]
-        
-        for pattern in duration_patterns:
-            match = re.search(pattern, page_text.lower())
+        for pattern in _PAT_DURATION:
+            match = pattern.search(page_text_lower)
             if match:
                 characteristics["duration_per_recording"] = match.group(0)
                 break
         
         # Extract age range
-        age_match = re.search(r"age[sd]?[:\s]+(\d+[-–to\s]+\d+)", page_text.lower())
+        age_match = _PAT_AGE.search(page_text_lower)
         if age_match:
             characteristics["age_range"] = age_match.group(1)
         
         # Extract gender distribution
-        gender_match = re.search(r"(\d+)\s*(?:male|female)", page_text.lower())
+        gender_match = _PAT_GENDER.search(page_text_lower)
         if gender_match:
             characteristics["gender_distribution"] = "Reported"
         
         # Extract data collection period
-        period_match = re.search(r"(19|20)\d{2}[-–to\s]+(19|20)\d{2}", page_text)
+        period_match = _PAT_PERIOD.search(page_text)
         if period_match:
             characteristics["data_collection_period"] = period_match.group(0)
         
         return characteristics
     
-    def extract_research_applications(self, page_text: str, soup: BeautifulSoup) -> list:
+    def extract_research_applications(self, page_text: str, soup: BeautifulSoup,
+                                      *, page_text_lower: Optional[str] = None, hits: Optional[dict] = None) -> list:
         """Extract potential research applications and use cases"""
-        applications = []
-        
-        application_keywords = {
-            "Classification": ["classification", "detection", "diagnosis"],
-            "Segmentation": ["segmentation", "localization"],
-            "Prediction": ["prediction", "prognosis", "forecasting"],
-            "Generation": ["generation", "synthesis", "report generation"],
-            "Question Answering": ["question answering", "vqa", "qa"],
-            "Summarization": ["summarization", "summarize"],
-            "Entity Recognition": ["entity recognition", "ner", "named entity"],
-            "Signal Processing": ["signal processing", "filtering", "feature extraction"],
-            "Deep Learning": ["deep learning", "neural network", "cnn", "rnn"],
-            "Transfer Learning": ["transfer learning", "pre-training"],
-            "Explainable AI": ["explainable", "interpretable", "xai"],
-            "Multimodal Learning": ["multimodal", "multi-modal", "fusion"],
-            "Time Series": ["time series", "temporal", "sequential"],
-            "Anomaly Detection": ["anomaly detection", "outlier"]
-        }
-        
-        for app, keywords in application_keywords.items():
-            if any(kw in page_text.lower() for kw in keywords):
-                applications.append(app)
+        if page_text_lower is None:
+            page_text_lower = page_text.lower()
+        if hits is None:
+            hits = self.scan_keywords(page_text_lower)
+        found = hits.get("application", ())
+        applications = [app for app in _APPLICATION_KEYWORDS if app in found]
         
         return applications[:10]  # Limit to top 10
     
-    def extract_limitations_and_challenges(self, soup: BeautifulSoup, page_text: str) -> list:
+    def extract_limitations_and_challenges(self, soup: BeautifulSoup, page_text: str,
+                                           *, page_text_lower: Optional[str] = None, tree=None) -> list:
         """Extract dataset limitations and known challenges"""
+        if page_text_lower is None:
+            page_text_lower = page_text.lower()
         limitations = []
         
         # Look for limitations section
-        limit_section = soup.find("section", id=re.compile(r"limitation", re.I)) or \
-                       soup.find("h2", string=re.compile(r"Limitations?", re.I))
-        
+        limit_text = None
+        limit_section = soup.find("section", id=_PAT_LIMITATION_ID)
         if limit_section:
-            limit_parent = limit_section.find_parent() if limit_section.name == "h2" else limit_section
-            limit_text = limit_parent.get_text()
-            
+            limit_text = limit_section.get_text()
+        else:
+            if tree is None:
+                tree = _tree_from_soup(soup)
+            limit_parent = _XP_LIMITATIONS_PARENT(tree)
+            if limit_parent:
+                limit_text = limit_parent[0].text_content()
+        
+        if limit_text is not None:
             # Extract bullet points or sentences
-            limit_items = re.split(r'[.\n•]', limit_text)
-            limitations = [item.strip() for item in limit_items if len(item.strip()) > 20][:5]
+            limit_items = _PAT_LIMIT_SPLIT.split(limit_text)
+            limitations = [item for item in map(str.strip, limit_items) if len(item) > 20][:5]
         
         # Look for common limitation patterns
-        limitation_patterns = [
-            r"small sample size",
-            r"limited to.*institution",
-            r"no control group",
-            r"imbalanced",
-            r"single center",
-            r"retrospective"
-        ]
-        
-        for pattern in limitation_patterns:
-            if re.search(pattern, page_text.lower()):
-                match = re.search(f"[^.]*{pattern}[^.]*", page_text.lower(), re.I)
-                if match:
-                    limitations.append(match.group(0).strip())
+        for phrase, sentence in _PAT_LIMITATION_PHRASES:
+            match = phrase.search(page_text_lower)
+            if match:
+                # The sentence starts after the last full stop before the first hit,
+                # so matching there gives the same text as sentence.search() would
+                start = page_text_lower.rfind(".", 0, match.start()) + 1
+                limitations.append(sentence.match(page_text_lower, start).group(0).strip())
         
         return list(set(limitations))[:5]  # Top 5 unique limitations
     
-    def extract_access_requirements(self, soup: BeautifulSoup, page_text: str) -> dict:
+    def extract_access_requirements(self, soup: BeautifulSoup, page_text: str,
+                                    *, page_text_lower: Optional[str] = None) -> dict:
         """Extract information about data access requirements"""
+        if page_text_lower is None:
+            page_text_lower = page_text.lower()
         access = {
             "access_type": "Not specified",
             "license": "Not specified",
@@ -523,39 +870,68 @@ class EnhancedPhysioNetExtractor:
         }
         
         # Determine access type
-        if "open access" in page_text.lower():
+        if "open access" in page_text_lower:
             access["access_type"] = "Open Access"
-        elif "credentialed" in page_text.lower() or "restricted" in page_text.lower():
+        elif "credentialed" in page_text_lower or "restricted" in page_text_lower:
             access["access_type"] = "Credentialed/Restricted"
-        elif "request" in page_text.lower():
+        elif "request" in page_text_lower:
             access["access_type"] = "Request Required"
         
         # Extract license
-        license_section = soup.find("a", href=re.compile(r"license", re.I))
+        license_section = soup.find("a", href=_HREF_LICENSE)
         if license_section:
             access["license"] = license_section.get_text(strip=True)
         
         # Check requirements
-        if "citi" in page_text.lower() or "training" in page_text.lower():
+        if "citi" in page_text_lower or "training" in page_text_lower:
             access["training_required"] = True
         
-        if "dua" in page_text.lower() or "data use agreement" in page_text.lower():
+        if "dua" in page_text_lower or "data use agreement" in page_text_lower:
             access["dua_required"] = True
         
-        if "credential" in page_text.lower():
+        if "credential" in page_text_lower:
             access["credentialing_required"] = True
         
         return access
     
-    async def extract_metadata(self, url: str) -> dict:
+    async def extract_metadata_batch(self, urls: list[str], force_refresh: bool = False) -> list[dict]:
+        """Extract several datasets concurrently, results in the same order as urls"""
+        sem = asyncio.Semaphore(MAX_CONCURRENT_EXTRACTIONS)
+        
+        async def one(url: str) -> dict:
+            async with sem:
+                return await self.extract_metadata(url, force_refresh=force_refresh)
+        
+        results = await asyncio.gather(*(one(url) for url in urls), return_exceptions=True)
+        return [
+            {"error": f"Failed to extract metadata: {str(r)}"} if isinstance(r, BaseException) else r
+            for r in results
+        ]
+    
+    async def extract_metadata(self, url: str, force_refresh: bool = False) -> dict:
         """Enhanced metadata extraction with comprehensive intelligence"""
         try:
+            # Already-curated datasets are served from the database unless a re-scrape is asked for
+            if not force_refresh:
+                self._load_datasets()
+                existing_index = self._url_index.get(url)
+                if existing_index is not None:
+                    print(f"Using curated record for: {url}", file=sys.stderr)
+                    # Deep copy: the row's lists (Authors, Limitations, ...) must not be shared with the cache
+                    return copy.deepcopy(self._datasets[existing_index])
+            
             print(f"Fetching URL: {url}", file=sys.stderr)
-            response = await self.client.get(url)
+            response = await self.client.get(url, headers=_NO_CACHE_HEADERS if force_refresh else None)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, "html.parser")
-            page_text = soup.get_text()
+            tree = _parse_tree(response.content, response.charset_encoding)
+            # One C-level traversal instead of BeautifulSoup's get_text() walk
+            page_text = tree.text_content()
+            # Still needed for the structural find()/find_all() lookups
+            soup = BeautifulSoup(response.content, HTML_PARSER)
+            page_text_lower = page_text.lower()
+            hits = self.scan_keywords(page_text_lower)
+            tokens = frozenset(_PAT_TOKEN.findall(page_text_lower))
             
             # Initialize comprehensive metadata structure
             metadata = {
@@ -639,7 +1015,7 @@ class EnhancedPhysioNetExtractor:
                 metadata["Title"] = title_elem.get_text(strip=True)
             
             # Extract version and DOI information
-            version_info = self.extract_version_and_doi(soup)
+            version_info = self.extract_version_and_doi(soup, tree=tree)
             metadata["Version"] = version_info["version"]
             metadata["Published_Date"] = version_info["published_date"]
             metadata["DOI_Version"] = version_info["doi_version"]
@@ -647,12 +1023,12 @@ class EnhancedPhysioNetExtractor:
             
             # Extract year from published date
             if metadata["Published_Date"] != "Not specified":
-                year_match = re.search(r"(19|20)\d{2}", metadata["Published_Date"])
+                year_match = _PAT_YEAR.search(metadata["Published_Date"])
                 if year_match:
                     metadata["Year"] = year_match.group(0)
             
             # Extract authors
-            author_info = self.extract_authors_and_affiliations(soup)
+            author_info = self.extract_authors_and_affiliations(soup, tree=tree)
             metadata["Authors"] = author_info["authors"]
             metadata["Corresponding_Author"] = author_info["corresponding_author"]
             
@@ -664,7 +1040,8 @@ class EnhancedPhysioNetExtractor:
                 metadata["Description"] = " ".join(desc_text.split()[:150])  # First 150 words
             
             # Extract detailed modalities
-            modality_info = self.extract_detailed_modalities(page_text, soup)
+            modality_info = self.extract_detailed_modalities(page_text, soup, page_text_lower=page_text_lower, hits=hits,
+                                                             tokens=tokens)
             metadata["Modalities_List"] = modality_info["modalities"]
             metadata["Physiological_Modality"] = ", ".join(modality_info["modalities"]) if modality_info["modalities"] else "Not specified"
             metadata["Sensors_Used"] = modality_info["sensors_used"]
@@ -672,14 +1049,14 @@ class EnhancedPhysioNetExtractor:
             metadata["Data_Formats"] = modality_info["data_formats"]
             
             # Extract clinical context
-            clinical_info = self.extract_clinical_context(page_text, soup)
+            clinical_info = self.extract_clinical_context(page_text, soup, page_text_lower=page_text_lower, hits=hits)
             metadata["Conditions_List"] = clinical_info["conditions"]
             metadata["Clinical_Condition"] = ", ".join(clinical_info["conditions"]) if clinical_info["conditions"] else "General healthy + mixed conditions"
             metadata["Patient_Population"] = clinical_info["patient_population"]
             metadata["Clinical_Setting"] = clinical_info["clinical_setting"]
             
             # Extract dataset characteristics
-            characteristics = self.extract_dataset_characteristics(page_text, soup)
+            characteristics = self.extract_dataset_characteristics(page_text, soup, page_text_lower=page_text_lower)
             metadata["Number_of_Subjects"] = characteristics["num_subjects"]
             metadata["Number_of_Recordings"] = characteristics["num_recordings"]
             metadata["Duration_Per_Recording"] = characteristics["duration_per_recording"]